@@ -2,3 +2,4 @@ from .eda_descriptive import EDA_Descriptive
 from .eda_text import EDA_Text
 from .eda_time_series import EDA_TimeSeries
 from .eda_publisher import EDA_Publisher
+from .headline_index import HeadlineIndex
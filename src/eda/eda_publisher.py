@@ -1,7 +1,12 @@
+import numpy as np
 import pandas as pd
 import re
 import matplotlib.pyplot as plt
 from pathlib import Path
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from .eda_text import EDA_Text
 
 class EDA_Publisher:
     """
@@ -10,6 +15,9 @@ class EDA_Publisher:
     """
     def __init__(self, df):
         self.df = df
+        self._X = None          # shared doc x term matrix, built on first use
+        self._terms = None
+        self._min_df = None     # min_df the cached matrix was built with
         # Ensure publisher column exists before proceeding
         if 'publisher' not in self.df.columns:
             raise ValueError("DataFrame must contain a 'publisher' column.")
@@ -73,7 +81,7 @@ class EDA_Publisher:
         
         return pub_counts, domain_counts
 
-    def publisher_content_analysis(self, top_n_domains=5):
+    def publisher_content_analysis(self, top_n_domains=5, min_df=5):
         """
         Analyzes content differences (simulated via headline length and top words)
         among the top contributing domains.
@@ -86,6 +94,7 @@ class EDA_Publisher:
         content_summary = self.df[self.df['publisher_domain'].isin(top_domains)].groupby('publisher_domain')['headline_len'].agg(['mean', 'median', 'std']).reset_index()
         
         # Plot: Compare average headline length
+        Path("reports/figures").mkdir(parents=True, exist_ok=True)
         plt.figure(figsize=(10, 5))
         plt.bar(content_summary['publisher_domain'], content_summary['mean'], color='teal')
         plt.errorbar(content_summary['publisher_domain'], content_summary['mean'], yerr=content_summary['std'], fmt='o', color='red', capsize=5)
@@ -102,20 +111,167 @@ class EDA_Publisher:
         print("-" * 50)
         print(content_summary.to_string(index=False))
 
-        # Placeholder for deeper content analysis (e.g., top words)
-        print("\n Deeper Content Hint (Top 3 Words for Largest Publisher):")
-        largest_domain = content_summary.sort_values('mean', ascending=False).iloc[0]['publisher_domain']
-        
-        # Mocking top words for demonstration
-        mock_top_words = {
-            'reuters.com': 'FED, RATES, QE',
-            'marketwatch.com': 'BUY, STOCK, ANALYST',
-            'zacks.com': 'Q4, EPS, TARGET'
-        }
-        
-        print(f" Largest Domain ({largest_domain}) Top Words: {mock_top_words.get(largest_domain, 'STOCK, MARKET, NEWS')}")
+        # Deeper content analysis: distinctive terms of the largest domain
+        largest_domain = self.df['publisher_domain'].value_counts().index[0]
+        try:
+            if self._X is not None and self._min_df == min_df:
+                top_words = self.distinctive_terms(top_n=3, min_df=min_df)
+            else:
+                # Fit the vocabulary on the shown domains only, not the whole corpus
+                shown = EDA_Publisher(self.df[self.df['publisher_domain'].isin(top_domains)])
+                top_words = shown.distinctive_terms(top_n=3, min_df=min_df)
+            top_words = top_words.loc[top_words['publisher_domain'] == largest_domain, 'term']
+        except ValueError:
+            # Too few headlines for the vocabulary (e.g. a small or filtered frame)
+            top_words = []
+        print(f"\n Largest Domain ({largest_domain}) Top Words: {', '.join(top_words).upper()}")
         
         return content_summary
 
+    # --- PUBLISHER ANALYTICS (grouped sparse reductions over all domains) ---
+
+    def _term_matrix(self, min_df=5):
+        """Shared doc x term count matrix over the cleaned headlines (built once per min_df)."""
+        if self._X is None or self._min_df != min_df:
+            clean = self.df['headline'].apply(EDA_Text.clean_headline)
+            vec = CountVectorizer(ngram_range=(1, 2), stop_words="english", min_df=min_df)
+            self._X = vec.fit_transform(clean).tocsr()
+            self._terms = vec.get_feature_names_out()
+            self._min_df = min_df
+        return self._X, self._terms
+
+    @staticmethod
+    def _group_matrix(codes, n_groups):
+        """Sparse group x doc indicator matrix; G @ values is a grouped sum."""
+        valid = codes >= 0
+        docs = np.flatnonzero(valid)
+        return sparse.csr_matrix(
+            (np.ones(len(docs)), (codes[valid], docs)), shape=(n_groups, len(codes))
+        )
+
+    def _domain_matrix(self):
+        if 'publisher_domain' not in self.df.columns:
+            self.extract_domains()
+        codes, domains = pd.factorize(self.df['publisher_domain'])
+        return self._group_matrix(codes, len(domains)), domains
+
+    def distinctive_terms(self, top_n=10, min_df=5):
+        """
+        Top terms per domain by weighted log-odds (informative Dirichlet prior)
+        of the domain against the rest of the corpus.
+        All domains are scored at once from the nonzero entries of G @ X.
+        """
+        X, terms = self._term_matrix(min_df=min_df)
+        G, domains = self._domain_matrix()
+
+        counts = (G @ X).tocoo()                       # domain x term counts
+        d, w, y_dw = counts.row, counts.col, counts.data
+        y_w = np.asarray(X.sum(axis=0)).ravel()        # corpus counts = prior
+        n_d = np.asarray(counts.tocsr().sum(axis=1)).ravel()
+        n = y_w.sum()
+
+        a_w = y_w[w]
+        y_rest = y_w[w] - y_dw
+        n_rest = n - n_d[d]
+        delta = (
+            np.log((y_dw + a_w) / (n_d[d] + n - y_dw - a_w))
+            - np.log((y_rest + a_w) / (n_rest + n - y_rest - a_w))
+        )
+        z = delta / np.sqrt(1.0 / (y_dw + a_w) + 1.0 / (y_rest + a_w))
 
+        # Top-N per domain: sort by (domain, -z) and keep the first N of each block
+        order = np.lexsort((-z, d))
+        d, w, y_dw, z = d[order], w[order], y_dw[order], z[order]
+        first = np.searchsorted(d, d, side='left')
+        keep = (np.arange(len(d)) - first) < top_n
+
+        return pd.DataFrame({
+            'publisher_domain': np.asarray(domains)[d[keep]],
+            'term': terms[w[keep]],
+            'count': y_dw[keep].astype(int),
+            'log_odds_z': z[keep],
+        })
+
+    def publisher_analytics(self, close_df=None, top_n_terms=10, min_obs=20, min_df=5,
+                            save_path="reports/figures/publisher_sentiment.png"):
+        """
+        Per-domain analytics for every publisher domain:
+        - article count, average headline length and sentiment
+        - distinctive terms (log-odds against the corpus)
+        - correlation of headline sentiment with the next-day return, per ticker
+
+        close_df : optional DataFrame of Close prices (dates x tickers)
+        Returns (summary, correlations).
+        """
+        if 'sentiment_score' not in self.df.columns:
+            from textblob import TextBlob
+            self.df.loc[:, 'sentiment_score'] = self.df['headline'].apply(
+                lambda x: TextBlob(str(x)).sentiment.polarity
+            )
+
+        G, domains = self._domain_matrix()
+        sentiment = self.df['sentiment_score'].to_numpy(dtype=float)
+
+        # 1. Domain-level means in one reduction
+        values = np.column_stack([np.ones(len(self.df)), self.df['headline_len'].to_numpy(float), sentiment])
+        sums = G @ values
+        summary = pd.DataFrame({
+            'publisher_domain': domains,
+            'articles': sums[:, 0].astype(int),
+            'avg_headline_len': sums[:, 1] / sums[:, 0],
+            'avg_sentiment': sums[:, 2] / sums[:, 0],
+        })
+        terms = self.distinctive_terms(top_n=top_n_terms, min_df=min_df)
+        terms = terms.groupby('publisher_domain', sort=False)['term'].agg(', '.join).rename('top_terms')
+        summary = summary.merge(terms, left_on='publisher_domain', right_index=True, how='left')
+        summary = summary.sort_values('articles', ascending=False).reset_index(drop=True)
+
+        # 2. Sentiment vs next-day return, grouped by (domain, ticker)
+        correlations = None
+        if close_df is not None:
+            close_df = close_df.copy()
+            close_df.index = pd.to_datetime(close_df.index).normalize()
+            next_ret = close_df.pct_change().shift(-1)
+
+            rows = next_ret.index.get_indexer(pd.to_datetime(self.df['date_only']))
+            cols = next_ret.columns.get_indexer(self.df['stock'])
+            ret = np.full(len(self.df), np.nan)
+            found = (rows >= 0) & (cols >= 0)
+            ret[found] = next_ret.to_numpy()[rows[found], cols[found]]
+            valid = ~np.isnan(ret) & ~np.isnan(sentiment)
+
+            # Group only on the (domain, ticker) pairs that actually occur
+            n_tickers = len(next_ret.columns)
+            domain_codes = pd.factorize(self.df['publisher_domain'])[0]
+            pair_codes, pairs = pd.factorize(domain_codes[valid].astype(np.int64) * n_tickers + cols[valid])
+            group = np.full(len(self.df), -1)
+            group[valid] = pair_codes
+            H = self._group_matrix(group, len(pairs))
+            x, y = np.where(valid, sentiment, 0.0), np.where(valid, ret, 0.0)
+            n, sx, sy, sxx, syy, sxy = (H @ np.column_stack([valid, x, y, x * x, y * y, x * y])).T
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cov = sxy - sx * sy / n
+                corr = cov / np.sqrt((sxx - sx * sx / n) * (syy - sy * sy / n))
+            idx = np.flatnonzero(n >= min_obs)
+            correlations = pd.DataFrame({
+                'publisher_domain': np.asarray(domains)[pairs[idx] // n_tickers],
+                'stock': next_ret.columns[pairs[idx] % n_tickers],
+                'n_headlines': n[idx].astype(int),
+                'next_day_corr': corr[idx],
+            }).sort_values(['publisher_domain', 'stock']).reset_index(drop=True)
+            print(f"✅ Sentiment/return correlation computed for {len(correlations)} domain-ticker pairs.")
+
+        # Plot: average sentiment of the most active domains
+        Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+        top = summary.head(20).sort_values('avg_sentiment')
+        plt.figure(figsize=(10, 6))
+        plt.barh(top['publisher_domain'], top['avg_sentiment'], color='teal')
+        plt.title('Average Headline Sentiment by Domain (Top 20 by Volume)')
+        plt.xlabel('Average Sentiment (TextBlob Polarity)')
+        plt.tight_layout()
+        plt.savefig(save_path)
+        plt.close()
+        print(f"✅ Publisher analytics complete for {len(summary)} domains. Plot saved: {save_path}")
 
+        return summary, correlations
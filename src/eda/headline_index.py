@@ -0,0 +1,368 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+
+from .eda_text import EDA_Text
+
+EMPTY = np.array([], dtype=np.int32)
+
+
+class _Segment:
+    """
+    One immutable block of the index: a CSC postings matrix whose rows (docs)
+    are sorted by (stock code, date), plus the per-doc key arrays.
+    """
+    def __init__(self, postings, doc_stock, doc_date, doc_id, doc_key):
+        self.postings = postings
+        self.doc_stock = doc_stock
+        self.doc_date = doc_date
+        self.doc_id = doc_id
+        self.doc_key = doc_key
+
+    def __len__(self):
+        return len(self.doc_id)
+
+    @classmethod
+    def empty(cls):
+        return cls(sparse.csc_matrix((0, 0), dtype=np.int8),
+                   np.array([], dtype=np.int32), np.array([], dtype=np.int64),
+                   np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+
+    @classmethod
+    def build(cls, X, doc_stock, doc_date, doc_id, doc_key):
+        """Sort docs by (stock, date) and convert the doc x term rows to postings."""
+        order = np.lexsort((doc_date, doc_stock))
+        postings = sparse.csr_matrix(X)[order].tocsc()
+        postings.sort_indices()
+        return cls(postings, doc_stock[order], doc_date[order], doc_id[order], doc_key[order])
+
+    @classmethod
+    def merge(cls, segments, n_terms):
+        """Fold several segments into one (the only full re-sort of the index)."""
+        blocks = []
+        for seg in segments:
+            X = seg.postings.tocsr()
+            X.resize((len(seg), n_terms))
+            blocks.append(X)
+        return cls.build(
+            sparse.vstack(blocks, format='csr'),
+            np.concatenate([seg.doc_stock for seg in segments]),
+            np.concatenate([seg.doc_date for seg in segments]),
+            np.concatenate([seg.doc_id for seg in segments]),
+            np.concatenate([seg.doc_key for seg in segments]),
+        )
+
+    def posting(self, col):
+        if col is None or col >= self.postings.shape[1]:
+            return EMPTY
+        start, end = self.postings.indptr[col], self.postings.indptr[col + 1]
+        return self.postings.indices[start:end]
+
+    def match(self, cols):
+        """Sorted doc positions containing every term column in cols."""
+        if not cols:
+            return EMPTY
+        result = self.posting(cols[0])
+        for col in cols[1:]:
+            result = np.intersect1d(result, self.posting(col), assume_unique=True)
+        return result
+
+    def doc_range(self, code, start_ns, end_ns):
+        """Contiguous [lo, hi) slice for a ticker code and a [start, end) date range."""
+        lo = np.searchsorted(self.doc_stock, code, side='left')
+        hi = np.searchsorted(self.doc_stock, code, side='right')
+        dates = self.doc_date[lo:hi]
+        start = 0 if start_ns is None else np.searchsorted(dates, start_ns, side='left')
+        end = len(dates) if end_ns is None else np.searchsorted(dates, end_ns, side='left')
+        return lo + start, lo + end
+
+    def search(self, all_of, any_of, none_of, code, start_ns, end_ns):
+        """Boolean query over this segment; each argument is a list of term-column lists."""
+        lo, hi = 0, len(self)
+        candidates = None
+        if code is not None:
+            lo, hi = self.doc_range(code, start_ns, end_ns)
+        elif start_ns is not None or end_ns is not None:
+            # Without a ticker the date key is only sorted within each stock
+            in_range = np.ones(len(self), dtype=bool)
+            if start_ns is not None:
+                in_range &= self.doc_date >= start_ns
+            if end_ns is not None:
+                in_range &= self.doc_date < end_ns
+            candidates = np.flatnonzero(in_range)
+
+        def restrict(ids):
+            ids = ids[np.searchsorted(ids, lo):np.searchsorted(ids, hi)]
+            if candidates is not None:
+                ids = np.intersect1d(ids, candidates, assume_unique=True)
+            return ids
+
+        if all_of:
+            result = restrict(self.match(all_of[0]))
+            for cols in all_of[1:]:
+                result = np.intersect1d(result, restrict(self.match(cols)), assume_unique=True)
+        elif any_of:
+            result = None
+        else:
+            result = restrict(np.arange(len(self), dtype=np.int32))
+
+        if any_of:
+            union = np.unique(np.concatenate([restrict(self.match(cols)) for cols in any_of]))
+            result = union if result is None else np.intersect1d(result, union, assume_unique=True)
+
+        for cols in none_of:
+            result = np.setdiff1d(result, self.match(cols), assume_unique=True)
+        return result
+
+
+class HeadlineIndex:
+    """
+    Persistent inverted index over news headlines.
+
+    - terms are unigrams + bigrams produced by EDA_Text.clean_headline
+    - posting lists are the columns of a CSC matrix (sorted int arrays of doc ids)
+    - posting rows are ordered by (stock, date), so a ticker / date range is a
+      contiguous slice found with np.searchsorted
+    - every headline gets a global doc id (insertion order, never reused) and an
+      external key: `key_col` (e.g. 'Unnamed: 0') or a (headline, stock, date)
+      hash matching FeatureStore's headline_id
+    - add() writes to a small delta segment; it is folded into the main
+      segment by merge(), automatically once it exceeds `merge_ratio` of it
+    """
+
+    def __init__(self, headline_col='headline', stock_col='stock', date_col='date', key_col=None,
+                 merge_ratio=0.1):
+        self.headline_col = headline_col
+        self.stock_col = stock_col
+        self.date_col = date_col
+        self.key_col = key_col
+        self.merge_ratio = merge_ratio
+
+        self.terms = {}                 # term -> column in postings
+        self.tickers = []               # ticker vocabulary, code = position (stable)
+        self._ticker_code = {}
+        self.main = _Segment.empty()
+        self.delta = _Segment.empty()
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self.main) + len(self.delta)
+
+    @property
+    def doc_id(self):
+        """Global ids of all indexed headlines."""
+        return np.concatenate([self.main.doc_id, self.delta.doc_id])
+
+    @property
+    def doc_key(self):
+        """External keys of all indexed headlines."""
+        return np.concatenate([self.main.doc_key, self.delta.doc_key])
+
+    def keys(self, df):
+        """External keys of the rows of df, as returned by search()."""
+        if self.key_col is not None:
+            return df[self.key_col].astype('int64')
+        dates = pd.to_datetime(df[self.date_col], format='mixed', utc=True).dt.as_unit('ns')
+        key = pd.DataFrame({
+            'headline': df[self.headline_col].astype(str),
+            'stock': df[self.stock_col].astype(str),
+            'date': dates.astype('int64'),
+        }, index=df.index)
+        return pd.util.hash_pandas_object(key, index=False).astype('int64')
+
+    def rows(self, df, keys):
+        """Rows of df whose keys are in a search() result."""
+        return df[self.keys(df).isin(keys).to_numpy()]
+
+    # --- PRIVATE HELPERS ---
+
+    @staticmethod
+    def _tokenize(df_headlines):
+        """Binary doc x term matrix over the cleaned headlines (unigrams + bigrams)."""
+        clean = df_headlines.apply(EDA_Text.clean_headline)
+        vec = CountVectorizer(
+            ngram_range=(1, 2), tokenizer=str.split, token_pattern=None,
+            lowercase=False, binary=True, dtype=np.int8,
+        )
+        try:
+            X = vec.fit_transform(clean)
+        except ValueError:
+            # Every headline cleaned down to nothing
+            return sparse.csr_matrix((len(clean), 0), dtype=np.int8), []
+        return X, vec.get_feature_names_out().tolist()
+
+    def _query_terms(self, text):
+        """Map a keyword or phrase to the index term columns that must all match."""
+        words = EDA_Text.clean_headline(text).split()
+        if len(words) > 1:
+            # Phrases are answered from the bigram postings: exact for two words,
+            # approximate for longer ones (the bigrams need not be adjacent)
+            words = [" ".join(pair) for pair in zip(words, words[1:])]
+        return [self.terms.get(term) for term in words]
+
+    @staticmethod
+    def _to_ns(value):
+        if value is None:
+            return None
+        ts = pd.Timestamp(value)
+        ts = ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+        return ts.value
+
+    # --- BUILD / UPDATE ---
+
+    def add(self, df):
+        """
+        Index new headlines (e.g. a freshly arrived news file).
+        Rows whose key is already indexed are skipped. Only the new rows are
+        tokenized and sorted into the delta segment; the main segment is not
+        touched until merge().
+        """
+        required = [self.headline_col, self.stock_col, self.date_col]
+        if self.key_col is not None:
+            required.append(self.key_col)
+        for col in required:
+            if col not in df.columns:
+                raise ValueError(f"DataFrame must contain a '{col}' column.")
+        missing = int(df[self.stock_col].isna().sum())
+        if missing:
+            raise ValueError(f"{missing} rows have no '{self.stock_col}' value; drop or fill them first.")
+
+        # Skip headlines that are already indexed or repeated within df
+        keys = self.keys(df)
+        new = (~keys.duplicated() & ~keys.isin(self.doc_key)).to_numpy()
+        df, keys = df[new], keys.to_numpy()[new]
+        if len(df) == 0:
+            print(f"✅ Indexed 0 headlines ({len(self)} total, {len(self.terms)} terms).")
+            return self
+
+        X_new, new_terms = self._tokenize(df[self.headline_col])
+
+        # Align the term vocabulary: existing columns keep their position
+        for term in new_terms:
+            self.terms.setdefault(term, len(self.terms))
+        col_map = np.array([self.terms[t] for t in new_terms], dtype=np.int64)
+        X_new = X_new.tocoo()
+        X_new = sparse.csr_matrix(
+            (X_new.data, (X_new.row, col_map[X_new.col])),
+            shape=(len(df), len(self.terms)), dtype=np.int8,
+        )
+
+        # Ticker codes are assigned in first-seen order, so they never change
+        stocks = df[self.stock_col].astype(str)
+        for ticker in stocks.unique():
+            if ticker not in self._ticker_code:
+                self._ticker_code[ticker] = len(self.tickers)
+                self.tickers.append(ticker)
+        doc_stock = stocks.map(self._ticker_code).to_numpy(dtype=np.int32)
+
+        dates = pd.to_datetime(df[self.date_col], format='mixed', utc=True)
+        doc_date = dates.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        doc_id = self._next_id + np.arange(len(df), dtype=np.int64)
+        self._next_id += len(df)
+
+        segment = _Segment.build(X_new, doc_stock, doc_date, doc_id, keys)
+        self.delta = _Segment.merge([self.delta, segment], len(self.terms))
+        if len(self.delta) > self.merge_ratio * len(self.main):
+            self.merge()
+
+        print(f"✅ Indexed {len(df)} headlines ({len(self)} total, {len(self.terms)} terms).")
+        return self
+
+    def merge(self):
+        """Fold the delta segment into the main segment."""
+        if len(self.delta):
+            self.main = _Segment.merge([self.main, self.delta], len(self.terms))
+            self.delta = _Segment.empty()
+        return self
+
+    @classmethod
+    def build(cls, df, **kwargs):
+        """Build a fresh index from a DataFrame returned by DataLoader.load_news_data."""
+        return cls(**kwargs).add(df)
+
+    # --- QUERY ---
+
+    def search(self, all_of=None, any_of=None, none_of=None, ticker=None, start=None, end=None):
+        """
+        Boolean keyword / phrase search.
+
+        all_of / any_of / none_of : str or list of str (multi-word entries are phrases;
+            two-word phrases match exactly, longer phrases match headlines that
+            contain each consecutive word pair, not necessarily adjacent)
+        ticker : restrict to one stock symbol
+        start, end : restrict to dates in [start, end)
+
+        Returns the external keys of the matching headlines (see keys() / rows()),
+        ordered by (stock, date).
+        """
+        def as_list(value):
+            return [value] if isinstance(value, str) else list(value or [])
+
+        all_of = [self._query_terms(t) for t in as_list(all_of)]
+        any_of = [self._query_terms(t) for t in as_list(any_of)]
+        none_of = [self._query_terms(t) for t in as_list(none_of)]
+
+        code = None
+        if ticker is not None:
+            code = self._ticker_code.get(ticker)
+            if code is None:
+                return np.array([], dtype=np.int64)
+        start_ns, end_ns = self._to_ns(start), self._to_ns(end)
+
+        stock, date, key = [], [], []
+        for seg in (self.main, self.delta):
+            if not len(seg):
+                continue
+            ids = seg.search(all_of, any_of, none_of, code, start_ns, end_ns)
+            stock.append(seg.doc_stock[ids])
+            date.append(seg.doc_date[ids])
+            key.append(seg.doc_key[ids])
+        if not key:
+            return np.array([], dtype=np.int64)
+
+        order = np.lexsort((np.concatenate(date), np.concatenate(stock)))
+        return np.concatenate(key)[order]
+
+    def count(self, **kwargs):
+        """Number of headlines matching a search() query."""
+        return len(self.search(**kwargs))
+
+    # --- PERSISTENCE ---
+
+    def save(self, path="reports/index/headline_index"):
+        """Save the index as <path>.npz (doc keys + vocab) and <path>_postings.npz."""
+        self.merge()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sparse.save_npz(f"{path}_postings.npz", self.main.postings, compressed=True)
+        terms = np.empty(len(self.terms), dtype=object)
+        for term, col in self.terms.items():
+            terms[col] = term
+        np.savez_compressed(
+            f"{path}.npz",
+            terms=terms.astype(str),
+            tickers=np.array(self.tickers, dtype=str),
+            doc_stock=self.main.doc_stock,
+            doc_date=self.main.doc_date,
+            doc_id=self.main.doc_id,
+            doc_key=self.main.doc_key,
+            cols=np.array([self.headline_col, self.stock_col, self.date_col, self.key_col or '']),
+        )
+        print(f"✅ Headline index saved: {path}.npz")
+
+    @classmethod
+    def load(cls, path="reports/index/headline_index"):
+        """Load an index written by save(); it can then be extended with add()."""
+        with np.load(f"{path}.npz") as data:
+            headline_col, stock_col, date_col, key_col = data['cols'].tolist()
+            index = cls(headline_col, stock_col, date_col, key_col or None)
+            index.terms = {term: col for col, term in enumerate(data['terms'].tolist())}
+            index.tickers = data['tickers'].tolist()
+            index._ticker_code = {ticker: code for code, ticker in enumerate(index.tickers)}
+            postings = sparse.load_npz(f"{path}_postings.npz").tocsc()
+            index.main = _Segment(postings, data['doc_stock'], data['doc_date'],
+                                  data['doc_id'], data['doc_key'])
+        index._next_id = int(index.main.doc_id.max()) + 1 if len(index.main) else 0
+        return index
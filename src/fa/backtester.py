@@ -0,0 +1,206 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+
+# Worker-side copies of the panels, set once per process by _init_worker
+_SIGNAL = None
+_RETURNS = None
+
+
+def _init_worker(signal, returns):
+    global _SIGNAL, _RETURNS
+    _SIGNAL, _RETURNS = signal, returns
+
+
+def _run_configs(configs):
+    """Daily PnL and turnover rows for a batch of configs (runs in a worker)."""
+    results = [Backtester.simulate(_SIGNAL, _RETURNS, **cfg) for cfg in configs]
+    return np.array([r[0] for r in results]), np.array([r[1] for r in results])
+
+
+class Backtester:
+    """
+    Vectorized signal backtester.
+
+    Turns a signal panel (dates x tickers), e.g. avg_daily_sentiment or the
+    RSI / MACD columns from TechnicalAnalyzer, into positions and evaluates
+    PnL, turnover, Sharpe and drawdown across the whole universe at once.
+    Config parameters: long_above, short_below, holding_period, cost_bps.
+    """
+    def __init__(self, signal_df: pd.DataFrame, close_df: pd.DataFrame):
+        signal_df = signal_df.copy()
+        close_df = close_df.copy()
+        signal_df.index = self._trading_dates(signal_df.index)
+        close_df.index = self._trading_dates(close_df.index)
+        close_df = close_df.sort_index()
+        tickers = signal_df.columns.intersection(close_df.columns)
+        if len(tickers) == 0 or len(signal_df.index.intersection(close_df.index)) == 0:
+            raise ValueError("Signal and price panels share no dates/tickers.")
+
+        # Returns come from consecutive closes; the signal is laid onto the
+        # trading calendar, NaN (no signal that day) meaning no new entry
+        returns = close_df[tickers].pct_change()
+        dates = close_df.index[close_df.index >= signal_df.index.min()]
+
+        self.dates = dates
+        self.tickers = tickers
+        self.signal = signal_df[tickers].reindex(dates).to_numpy(dtype=float)
+        self.returns = returns.loc[dates].to_numpy(dtype=float)
+        print(f"✅ Backtester initialized: {len(dates)} days x {len(tickers)} tickers.")
+
+    @staticmethod
+    def _trading_dates(index):
+        """Midnight, tz-naive dates (tz-aware stamps keep their local calendar date)."""
+        index = pd.to_datetime(index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+        return index.normalize()
+
+    @staticmethod
+    def signal_panel(frames, column):
+        """Build a dates x tickers panel from {ticker: DataFrame} (e.g. TechnicalAnalyzer.df)."""
+        return pd.DataFrame({ticker: df[column] for ticker, df in frames.items()})
+
+    @staticmethod
+    def param_grid(**params):
+        """Cartesian product of parameter lists -> list of config dicts."""
+        keys = list(params)
+        return [dict(zip(keys, values)) for values in itertools.product(*params.values())]
+
+    @staticmethod
+    def simulate(signal, returns, long_above=0.0, short_below=None, holding_period=1, cost_bps=0.0):
+        """
+        Simulate one config on (dates x tickers) arrays.
+
+        - enter long when signal > long_above, short when signal < short_below
+        - each entry is held for holding_period trading days (rows of the arrays;
+          overlapping entries are averaged)
+        - weights are scaled so gross exposure never exceeds 1
+        - today's weights earn tomorrow's return; costs are charged on turnover
+        Returns (daily_pnl, daily_turnover).
+        """
+        if isinstance(holding_period, bool) or not isinstance(holding_period, (int, np.integer)) \
+                or holding_period < 1:
+            raise ValueError(f"holding_period must be an integer >= 1, got {holding_period!r}.")
+
+        entries = np.where(signal > long_above, 1.0, 0.0)
+        if short_below is not None:
+            entries -= np.where(signal < short_below, 1.0, 0.0)
+
+        # Rolling mean of entries over the holding period via cumulative sums
+        csum = np.cumsum(entries, axis=0)
+        held = csum.copy()
+        held[holding_period:] -= csum[:-holding_period]
+        position = held / holding_period
+
+        gross = np.abs(position).sum(axis=1, keepdims=True)
+        weights = position / np.maximum(gross, 1.0)
+
+        prev = np.vstack([np.zeros((1, weights.shape[1])), weights[:-1]])
+        turnover = np.abs(weights - prev).sum(axis=1)
+        pnl = np.nansum(prev * returns, axis=1) - turnover * cost_bps / 1e4
+        return pnl, turnover
+
+    @staticmethod
+    def metrics(pnl, turnover):
+        """Summary statistics for a daily PnL series."""
+        std = pnl.std()
+        equity = np.cumprod(1 + pnl)
+        running_max = np.maximum.accumulate(equity)
+        return {
+            'total_return': float(equity[-1] - 1) if len(pnl) else 0.0,
+            'sharpe': float(pnl.mean() / std * np.sqrt(TRADING_DAYS)) if std > 0 else 0.0,
+            'max_drawdown': float(np.min(equity / running_max - 1)) if len(pnl) else 0.0,
+            'avg_turnover': float(turnover.mean()) if len(pnl) else 0.0,
+        }
+
+    def run(self, **config):
+        """Backtest a single config over the full period."""
+        pnl, turnover = self.simulate(self.signal, self.returns, **config)
+        result = pd.DataFrame({'pnl': pnl, 'turnover': turnover}, index=self.dates)
+        result['equity'] = (1 + result['pnl']).cumprod()
+        return result, self.metrics(pnl, turnover)
+
+    def sweep(self, configs, n_jobs=None, batch_size=25):
+        """
+        Run every config over the full period, parallelized over a process pool.
+        The panels are shipped to each worker once, not per config.
+        Returns (pnl, turnover) arrays of shape (n_configs, n_days).
+        """
+        n_jobs = n_jobs or os.cpu_count() or 1
+        batches = [configs[i:i + batch_size] for i in range(0, len(configs), batch_size)]
+
+        if n_jobs == 1:
+            _init_worker(self.signal, self.returns)
+            results = [_run_configs(batch) for batch in batches]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs, initializer=_init_worker, initargs=(self.signal, self.returns)
+            ) as pool:
+                results = list(pool.map(_run_configs, batches))
+
+        pnl = np.vstack([r[0] for r in results])
+        turnover = np.vstack([r[1] for r in results])
+        print(f"✅ Sweep complete: {len(configs)} configs.")
+        return pnl, turnover
+
+    def sweep_report(self, configs, n_jobs=None):
+        """Full-period metrics for every config, sorted by Sharpe."""
+        pnl, turnover = self.sweep(configs, n_jobs=n_jobs)
+        report = pd.DataFrame([self.metrics(p, t) for p, t in zip(pnl, turnover)])
+        report = pd.concat([pd.DataFrame(configs), report], axis=1)
+        return report.sort_values('sharpe', ascending=False).reset_index(drop=True)
+
+    def walk_forward(self, configs, n_splits=5, train_days=TRADING_DAYS, n_jobs=None):
+        """
+        Walk-forward evaluation: on each fold, pick the config with the best
+        Sharpe on the preceding train window and score it on the next test window.
+
+        Positions only use past signals, so every config is simulated once over
+        the full period and the folds are slices of the daily PnL.
+        Returns (folds, oos) where oos is the stitched out-of-sample PnL.
+        """
+        n_days = len(self.dates)
+        test_days = (n_days - train_days) // n_splits
+        if test_days <= 0:
+            raise ValueError(f"Not enough days ({n_days}) for train_days={train_days} and {n_splits} splits.")
+
+        pnl, turnover = self.sweep(configs, n_jobs=n_jobs)
+
+        folds, oos = [], []
+        for k in range(n_splits):
+            test_start = train_days + k * test_days
+            train = slice(test_start - train_days, test_start)
+            test = slice(test_start, test_start + test_days)
+
+            train_pnl = pnl[:, train]
+            std = train_pnl.std(axis=1)
+            sharpe = np.where(std > 0, train_pnl.mean(axis=1) / np.where(std > 0, std, 1), -np.inf)
+            best = int(np.argmax(sharpe))
+
+            stats = self.metrics(pnl[best, test], turnover[best, test])
+            folds.append({
+                'train_start': self.dates[train.start].date(),
+                'test_start': self.dates[test.start].date(),
+                'test_end': self.dates[test.stop - 1].date(),
+                **configs[best],
+                'train_sharpe': float(sharpe[best] * np.sqrt(TRADING_DAYS)),
+                **{f'test_{key}': value for key, value in stats.items()},
+            })
+            oos.append(pd.DataFrame(
+                {'pnl': pnl[best, test], 'turnover': turnover[best, test]},
+                index=self.dates[test],
+            ))
+
+        folds = pd.DataFrame(folds)
+        oos = pd.concat(oos)
+        oos['equity'] = (1 + oos['pnl']).cumprod()
+        summary = self.metrics(oos['pnl'].to_numpy(), oos['turnover'].to_numpy())
+        print(f"✅ Walk-forward complete: OOS Sharpe {summary['sharpe']:.2f}, "
+              f"Max Drawdown {summary['max_drawdown']:.2%}")
+        return folds, oos
@@ -9,14 +9,16 @@ class CorrelationAnalyzer:
     Analyzes the correlation between aggregated daily news sentiment
     and subsequent daily stock returns.
     """
-    def __init__(self, news_df: pd.DataFrame, stock_df: pd.DataFrame, headline_col='headline'):
-        self.news_df = news_df.copy()
-        self.stock_df = stock_df.copy()
+    def __init__(self, news_df: pd.DataFrame, stock_df: pd.DataFrame, headline_col='headline', copy=True):
+        # copy=False keeps a shallow copy: new columns stay local, the data
+        # itself is shared (e.g. SharedData views in multi-process workers)
+        self.news_df = news_df.copy(deep=copy)
+        self.stock_df = stock_df.copy(deep=copy)
         self.headline_col = headline_col
         self.merged_df = None
         
-        # Ensure necessary columns/index exist
-        if headline_col not in self.news_df.columns:
+        # Ensure necessary columns/index exist (headlines are not needed once scored)
+        if headline_col not in self.news_df.columns and 'sentiment_score' not in self.news_df.columns:
              raise ValueError(f"News DataFrame must contain a '{headline_col}' column.")
         if 'Close' not in self.stock_df.columns:
              raise ValueError("Stock DataFrame must contain a 'Close' column.")
@@ -39,32 +41,42 @@ class CorrelationAnalyzer:
         print("✅ Sentiment analysis complete.")
         return self.news_df
 
-    def align_and_aggregate_data(self):
+    def align_and_aggregate_data(self, daily_sentiment=None):
         """
         1. Aligns news (sentiment) and stock data by date.
         2. Aggregates news sentiment to a daily average.
         3. Calculates lagged daily stock returns (The Predictive Feature).
-        """
-        # Step 1: Ensure dates are in the correct format for merging
-
-        # News Data: Extract date (assuming 'date' is a datetime column or index)
-        if self.news_df.index.name != 'Date':
-            # Assuming a column named 'date' or 'Date' exists
-            date_col = next((col for col in self.news_df.columns if 'date' in col.lower()), None)
-            if date_col:
-                self.news_df['Date'] = pd.to_datetime(self.news_df[date_col]).dt.date
-                self.news_df.set_index('Date', inplace=True)
-            else:
-                 raise ValueError("Could not find a date column in the news data for alignment.")
 
+        daily_sentiment : optional precomputed daily features indexed by date
+        (e.g. FeatureStore.read_daily(ticker)); skips the news aggregation.
+        """
         # Stock Data: Use existing Date index (from StockDataset loader)
         # self.stock_df.index = self.stock_df.index.date
         self.stock_df.index = pd.to_datetime(self.stock_df.index).date
 
-        # Step 2: Aggregate daily sentiment
-        daily_sentiment = self.news_df.groupby(self.news_df.index)['sentiment_score'].agg(['mean', 'count']).rename(
-            columns={'mean': 'avg_daily_sentiment', 'count': 'daily_news_volume'}
-        )
+        if daily_sentiment is None:
+            # Step 1: Ensure dates are in the correct format for merging
+
+            # News Data: Extract date (assuming 'date' is a datetime column or index)
+            if self.news_df.index.name != 'Date':
+                # Assuming a column named 'date' or 'Date' exists
+                date_col = next((col for col in self.news_df.columns if 'date' in col.lower()), None)
+                if date_col:
+                    self.news_df['Date'] = pd.to_datetime(self.news_df[date_col]).dt.date
+                    self.news_df.set_index('Date', inplace=True)
+                else:
+                     raise ValueError("Could not find a date column in the news data for alignment.")
+
+            # Step 2: Aggregate daily sentiment
+            daily_sentiment = self.news_df.groupby(self.news_df.index)['sentiment_score'].agg(['mean', 'count']).rename(
+                columns={'mean': 'avg_daily_sentiment', 'count': 'daily_news_volume'}
+            )
+        else:
+            missing = [col for col in ('avg_daily_sentiment', 'daily_news_volume') if col not in daily_sentiment.columns]
+            if missing:
+                raise ValueError(f"Precomputed daily sentiment is missing columns: {missing}")
+            daily_sentiment = daily_sentiment.copy()
+            daily_sentiment.index = pd.to_datetime(daily_sentiment.index).date
         print(f" Daily sentiment aggregated over {len(daily_sentiment)} days.")
 
         # Step 3: Calculate Stock Returns & Lagged Returns (The Target)
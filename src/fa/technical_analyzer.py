@@ -9,9 +9,10 @@ class TechnicalAnalyzer:
     Handles technical indicator calculation (using TA-Lib) and visualization.
     Accepts standard OHLCV column names (case-insensitive).
     """
-    def __init__(self, df: pd.DataFrame, ticker: str):
+    def __init__(self, df: pd.DataFrame, ticker: str, copy=True):
         # Normalize column names to title-case (Open, High, Low, Close, Volume)
-        df = df.copy()
+        # copy=False only copies the frame, not the underlying (possibly shared) arrays
+        df = df.copy(deep=copy)
         df.columns = df.columns.str.strip().str.title()
         
         # Validate required columns (now in title-case)
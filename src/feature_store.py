@@ -0,0 +1,241 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+PARTITION_FIELDS = [pa.field('stock', pa.string()), pa.field('month', pa.string())]
+PARTITIONING = ds.partitioning(pa.schema(PARTITION_FIELDS), flavor='hive')
+
+# Every partition file is written with the same schema (optional columns are
+# null-filled), so dataset scans never drop columns missing from one fragment
+SCHEMAS = {
+    'headlines': pa.schema([
+        ('headline', pa.string()),
+        ('date', pa.timestamp('ns', tz='UTC')),
+        ('publisher', pa.string()),
+        ('sentiment_score', pa.float64()),
+        ('headline_id', pa.int64()),
+    ]),
+    'daily': pa.schema([
+        ('date', pa.date32()),
+        ('avg_daily_sentiment', pa.float64()),
+        ('daily_news_volume', pa.int64()),
+        ('std_daily_sentiment', pa.float64()),
+        ('positive_share', pa.float64()),
+        ('negative_share', pa.float64()),
+    ]),
+}
+
+
+class FeatureStore:
+    """
+    Persistent sentiment feature store (Parquet, partitioned by stock and month).
+
+    - headlines/stock=<T>/month=<YYYY-MM>/ : per-headline sentiment scores
+    - daily/stock=<T>/month=<YYYY-MM>/     : daily mean, count, std, share of
+                                             positive / negative headlines
+
+    upsert() only scores headlines not already stored and rewrites the touched
+    partitions in one batch; reads push ticker/date filters down to the Parquet
+    scan and, for a single ticker, only list that ticker's partition files.
+    """
+    def __init__(self, root="data/features", headline_col='headline'):
+        self.root = Path(root)
+        self.headline_col = headline_col
+
+    # --- PRIVATE HELPERS ---
+
+    def _partition_file(self, table, stock, month):
+        return self.root / table / f"stock={quote(str(stock), safe='')}" / f"month={month}" / "part-0.parquet"
+
+    def _prepare(self, news_df):
+        """Keyed, partitioned copy of the news columns needed by the store."""
+        for col in (self.headline_col, 'stock', 'date'):
+            if col not in news_df.columns:
+                raise ValueError(f"News DataFrame must contain a '{col}' column.")
+        df = pd.DataFrame({
+            'headline': news_df[self.headline_col].astype(str),
+            'stock': news_df['stock'].astype(str),
+            'date': pd.to_datetime(news_df['date'], format='mixed', utc=True).dt.as_unit('ns'),
+        }, index=news_df.index)
+        # Optional column, always present so every partition shares one schema
+        if 'publisher' in news_df.columns:
+            df['publisher'] = news_df['publisher'].astype(str)
+        else:
+            df['publisher'] = None
+        if 'sentiment_score' in news_df.columns:
+            df['sentiment_score'] = news_df['sentiment_score'].astype(float)
+
+        # Stable key so re-delivered headlines are not stored or scored twice
+        key = df[['headline', 'stock']].assign(date=df['date'].astype('int64'))
+        df['headline_id'] = pd.util.hash_pandas_object(key, index=False).astype('int64')
+        # 'YYYY-MM' partition key, formatted once per distinct month
+        months, codes = np.unique(df['date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]'),
+                                  return_inverse=True)
+        df['month'] = np.datetime_as_string(months, unit='M')[codes]
+        return df
+
+    @staticmethod
+    def _score(headlines):
+        from textblob import TextBlob
+        return headlines.apply(lambda x: TextBlob(str(x)).sentiment.polarity)
+
+    @staticmethod
+    def _aggregate_daily(headlines):
+        """Daily sentiment features per (stock, month) partition of scored headlines."""
+        score = headlines['sentiment_score']
+        daily = pd.DataFrame({
+            'stock': headlines['stock'],
+            'month': headlines['month'],
+            'date': headlines['date'].dt.date,
+            'score': score,
+            'positive': (score > 0).astype(float),
+            'negative': (score < 0).astype(float),
+        }).groupby(['stock', 'month', 'date']).agg(
+            avg_daily_sentiment=('score', 'mean'),
+            daily_news_volume=('score', 'count'),
+            std_daily_sentiment=('score', 'std'),
+            positive_share=('positive', 'mean'),
+            negative_share=('negative', 'mean'),
+        )
+        return daily.reset_index()
+
+    def _write(self, df, table):
+        """Rewrite every (stock, month) partition present in df in one dataset write."""
+        schema = pa.schema(list(SCHEMAS[table]) + PARTITION_FIELDS)
+        df = df.sort_values(['stock', 'month', 'date']).reindex(columns=schema.names)
+        ds.write_dataset(
+            pa.Table.from_pandas(df, schema=schema, preserve_index=False),
+            self.root / table,
+            format='parquet',
+            partitioning=PARTITIONING,
+            basename_template='part-{i}.parquet',
+            existing_data_behavior='delete_matching',
+            max_partitions=max(df.groupby(['stock', 'month']).ngroups, 1),
+            preserve_order=True,
+        )
+
+    def _dataset(self, table, files=None):
+        """Dataset over the whole table, or over an explicit list of partition files."""
+        schema = pa.schema(list(SCHEMAS[table]) + PARTITION_FIELDS)
+        path = self.root / table
+        if files is None:
+            return ds.dataset(path, schema=schema, format='parquet', partitioning=PARTITIONING)
+        return ds.dataset([str(f) for f in files], schema=schema, format='parquet',
+                          partitioning=PARTITIONING, partition_base_dir=str(path))
+
+    def _stored_files(self, table, partitions):
+        """Existing partition files for (stock, month) pairs."""
+        files = (self._partition_file(table, stock, month) for stock, month in partitions)
+        return [f for f in files if f.exists()]
+
+    @staticmethod
+    def _utc(value):
+        ts = pd.Timestamp(value)
+        return ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')
+
+    def _filter(self, ticker, start, end, date_type):
+        """Partition (stock, month) + row-level date predicate for a dataset scan."""
+        def as_scalar(ts):
+            return pa.scalar(ts.date() if pa.types.is_date(date_type) else ts.as_unit('ns').value, date_type)
+
+        conditions = []
+        if ticker is not None:
+            conditions.append(ds.field('stock') == ticker)
+        if start is not None:
+            start = self._utc(start)
+            conditions.append(ds.field('month') >= start.strftime('%Y-%m'))
+            conditions.append(ds.field('date') >= as_scalar(start))
+        if end is not None:
+            end = self._utc(end)
+            conditions.append(ds.field('month') <= end.strftime('%Y-%m'))
+            conditions.append(ds.field('date') < as_scalar(end))
+
+        expr = None
+        for condition in conditions:
+            expr = condition if expr is None else expr & condition
+        return expr
+
+    def _read(self, table, ticker, start, end, date_type, columns=None):
+        path = self.root / table
+        if not path.exists():
+            raise FileNotFoundError(f"No '{table}' features stored under {self.root}. Run upsert() first.")
+        if ticker is None:
+            dataset = self._dataset(table)
+        else:
+            # Only list the ticker's own directory instead of discovering the whole tree
+            stock_dir = path / f"stock={quote(str(ticker), safe='')}"
+            dataset = self._dataset(table, sorted(stock_dir.glob("month=*/*.parquet")))
+        result = dataset.to_table(columns=columns, filter=self._filter(ticker, start, end, date_type))
+        return result.to_pandas().drop(columns=['month'], errors='ignore')
+
+    # --- WRITE ---
+
+    def upsert(self, news_df):
+        """
+        Add new headlines (e.g. a freshly arrived news file) to the store.
+        Already-stored headlines are skipped; only new ones are scored
+        (unless news_df already carries a 'sentiment_score' column).
+        Returns the number of headlines added.
+        """
+        df = self._prepare(news_df).drop_duplicates('headline_id')
+
+        # One scan of the stored ids in the partitions this file falls into
+        partitions = df[['stock', 'month']].drop_duplicates().itertuples(index=False)
+        files = self._stored_files('headlines', partitions)
+        stored = np.empty(0, dtype=np.int64)
+        if files:
+            stored = self._dataset('headlines', files).to_table(columns=['headline_id'])['headline_id']
+            stored = stored.to_numpy()
+        new = df[~df['headline_id'].isin(stored)]
+        if new.empty:
+            print("✅ Feature store updated: 0 new headlines in 0 partitions.")
+            return 0
+
+        if 'sentiment_score' not in new.columns:
+            new = new.assign(sentiment_score=self._score(new['headline']))
+
+        # Touched partitions are rewritten whole, existing rows read in one scan
+        touched = new[['stock', 'month']].drop_duplicates()
+        files = self._stored_files('headlines', touched.itertuples(index=False))
+        merged = new
+        if files:
+            existing = self._dataset('headlines', files).to_table().to_pandas()
+            merged = pd.concat([existing, new], ignore_index=True)
+
+        self._write(merged, 'headlines')
+        self._write(self._aggregate_daily(merged), 'daily')
+        print(f"✅ Feature store updated: {len(new)} new headlines in {len(touched)} partitions.")
+        return len(new)
+
+    # --- READ ---
+
+    def read_headlines(self, ticker=None, start=None, end=None, columns=None):
+        """Per-headline scores for a ticker and a [start, end) date range."""
+        return self._read('headlines', ticker, start, end, pa.timestamp('ns', tz='UTC'), columns)
+
+    def read_daily(self, ticker=None, start=None, end=None):
+        """
+        Daily sentiment features for a [start, end) date range.
+        With a ticker, the result is indexed by 'Date' (datetime.date), ready for
+        CorrelationAnalyzer.align_and_aggregate_data(daily_sentiment=...).
+        """
+        daily = self._read('daily', ticker, start, end, pa.date32())
+        daily['date'] = pd.to_datetime(daily['date']).dt.date
+        if ticker is None:
+            return daily.sort_values(['stock', 'date']).reset_index(drop=True)
+        return daily.drop(columns=['stock']).rename(columns={'date': 'Date'}).set_index('Date').sort_index()
+
+    def attach_scores(self, news_df):
+        """
+        Return news_df with stored 'sentiment_score' values joined on, so the
+        EDA / correlation code can skip rescoring. Missing headlines get NaN.
+        """
+        keys = self._prepare(news_df)
+        start, end = keys['date'].min(), keys['date'].max() + pd.Timedelta(1, 'ns')
+        stored = self.read_headlines(start=start, end=end, columns=['headline_id', 'sentiment_score'])
+        scores = stored.drop_duplicates('headline_id').set_index('headline_id')['sentiment_score']
+        return news_df.assign(sentiment_score=keys['headline_id'].map(scores).to_numpy())
@@ -0,0 +1,224 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from multiprocessing import shared_memory
+
+PRICE_FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Open shared memory blocks of this process, by name. Views can outlive the
+# SharedData object that made them, so blocks stay mapped until close()
+_OPEN_BLOCKS = {}
+
+
+class SharedData:
+    """
+    Shared, zero-copy data layer for multi-process analysis workers.
+
+    The parent exports the loaded news columns (int64 timestamps, categorical
+    codes, sentiment floats) and the OHLCV price panel once, either into
+    multiprocessing.shared_memory blocks or memory-mapped .npy files.
+    Workers attach with the small picklable `spec` and get read-only NumPy
+    views / DataFrames without copying:
+
+        data = SharedData.create(news_df, price_frames)
+        with ProcessPoolExecutor(initializer=init, initargs=(data.spec,)) as pool:
+            ...                                   # init: SharedData.attach(spec)
+        data.unlink()
+    """
+    def __init__(self, spec, arrays, handles=()):
+        self.spec = spec
+        self.arrays = arrays
+        self._handles = list(handles)   # keep shared memory blocks alive
+
+    # --- EXPORT (parent process) ---
+
+    @classmethod
+    def create(cls, news_df=None, price_frames=None, sentiment_col='sentiment_score',
+               categorical_cols=('stock', 'publisher'), backend='shm', path=None):
+        """
+        Export news columns and/or price data.
+
+        news_df : DataFrame from DataLoader.load_news_data (optionally with sentiment)
+        price_frames : {ticker: OHLCV DataFrame} as returned by StockDataset.load
+        backend : 'shm' (multiprocessing.shared_memory) or 'npy' (memmapped files in `path`)
+        """
+        if backend not in ('shm', 'npy'):
+            raise ValueError(f"Unknown backend '{backend}'. Use 'shm' or 'npy'.")
+        if backend == 'npy' and path is None:
+            raise ValueError("The 'npy' backend needs a directory `path`.")
+
+        arrays, meta = {}, {'categories': {}}
+
+        if news_df is not None:
+            dates = pd.to_datetime(news_df['date'], format='mixed', utc=True)
+            arrays['news/date'] = dates.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            for col in categorical_cols:
+                if col in news_df.columns:
+                    cat = pd.Categorical(news_df[col])
+                    arrays[f'news/{col}'] = cat.codes
+                    meta['categories'][col] = cat.categories.tolist()
+            if sentiment_col in news_df.columns:
+                arrays['news/sentiment_score'] = news_df[sentiment_col].to_numpy(dtype=np.float64)
+
+        if price_frames:
+            # Stack into (tickers, fields, dates) on the union of dates, so each
+            # ticker's OHLCV block and each field row stay contiguous
+            frames = {t: df.rename(columns=str.title) for t, df in price_frames.items()}
+            dates = pd.DatetimeIndex(sorted(set().union(*(df.index for df in frames.values()))))
+            panel = np.full((len(frames), len(PRICE_FIELDS), len(dates)), np.nan)
+            for i, df in enumerate(frames.values()):
+                rows = dates.get_indexer(df.index)
+                panel[i][:, rows] = df[PRICE_FIELDS].to_numpy(dtype=np.float64).T
+            arrays['price/panel'] = panel
+            arrays['price/dates'] = dates.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            meta['tickers'] = list(frames)
+
+        spec = {'backend': backend, 'meta': meta, 'arrays': {}}
+        views, handles = {}, []
+        for name, arr in arrays.items():
+            arr = np.ascontiguousarray(arr)
+            if backend == 'shm':
+                shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+                view = cls._view(shm, arr.shape, arr.dtype)
+                handles.append(shm)
+                location = shm.name
+            else:
+                location = str(Path(path) / f"{name.replace('/', '__')}.npy")
+                Path(location).parent.mkdir(parents=True, exist_ok=True)
+                view = np.lib.format.open_memmap(location, mode='w+', dtype=arr.dtype, shape=arr.shape)
+            view[...] = arr
+            if backend == 'npy':
+                view.flush()
+            view.flags.writeable = False
+            views[name] = view
+            spec['arrays'][name] = (location, arr.shape, arr.dtype.str)
+
+        print(f"✅ Exported {len(views)} shared arrays "
+              f"({sum(v.nbytes for v in views.values()) / 1e6:.1f} MB, backend={backend}).")
+        return cls(spec, views, handles)
+
+    # --- ATTACH (worker process) ---
+
+    @classmethod
+    def attach(cls, spec):
+        """Attach to exported data as read-only views; nothing is copied."""
+        views, handles = {}, []
+        for name, (location, shape, dtype) in spec['arrays'].items():
+            if spec['backend'] == 'shm':
+                shm = cls._open_shm(location)
+                view = cls._view(shm, shape, dtype)
+                handles.append(shm)
+            else:
+                view = np.load(location, mmap_mode='r')
+            view.flags.writeable = False
+            views[name] = view
+        return cls(spec, views, handles)
+
+    @staticmethod
+    def _view(shm, shape, dtype):
+        """Array over a shared memory block; it holds a buffer export, so the
+        block cannot be unmapped underneath it."""
+        _OPEN_BLOCKS[shm.name] = shm
+        return np.frombuffer(shm.buf, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+    @staticmethod
+    def _open_shm(name):
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)   # Python >= 3.13
+        except TypeError:
+            # Pool workers share the parent's resource tracker, so registering
+            # the block again is a no-op and it is still unlinked only once
+            return shared_memory.SharedMemory(name=name)
+
+    # --- VIEWS ---
+
+    def news_frame(self):
+        """News columns as a DataFrame backed by the shared arrays ('date' is UTC)."""
+        columns = {}
+        for name, arr in self.arrays.items():
+            if not name.startswith('news/'):
+                continue
+            col = name.split('/', 1)[1]
+            if col == 'date':
+                columns[col] = self._utc_dates(arr)
+            elif col in self.spec['meta']['categories']:
+                dtype = pd.CategoricalDtype(self.spec['meta']['categories'][col])
+                columns[col] = pd.Categorical.from_codes(arr, dtype=dtype)
+            else:
+                columns[col] = arr
+        if not columns:
+            raise ValueError("No news data was exported.")
+        return pd.DataFrame(columns, copy=False)
+
+    @staticmethod
+    def _utc_dates(arr):
+        """
+        tz-aware UTC view of int64 ns timestamps, matching DataLoader's 'date'.
+        pandas has no public zero-copy constructor for tz-aware arrays (every
+        tz_localize / astype path allocates), so the buffer is wrapped with
+        DatetimeArray._simple_new; if a pandas release removes it, the dates
+        are copied instead and a RuntimeWarning says so.
+        """
+        view = arr.view('datetime64[ns]')
+        simple_new = getattr(pd.arrays.DatetimeArray, '_simple_new', None)
+        if simple_new is not None:
+            return simple_new(view, dtype=pd.DatetimeTZDtype('ns', 'UTC'))
+        warnings.warn(
+            f"pandas {pd.__version__} has no DatetimeArray._simple_new; "
+            "news 'date' is copied out of shared memory.",
+            RuntimeWarning, stacklevel=3,
+        )
+        return pd.Series(view, copy=False).dt.tz_localize('UTC').array
+
+    @property
+    def tickers(self):
+        return self.spec['meta'].get('tickers', [])
+
+    def _price_dates(self):
+        return pd.DatetimeIndex(self.arrays['price/dates'].view('datetime64[ns]'), name='Date')
+
+    def price_frame(self, ticker):
+        """OHLCV DataFrame view for one ticker, trimmed to its own date range."""
+        if ticker not in self.tickers:
+            raise ValueError(f"Ticker {ticker} was not exported. Available: {self.tickers}")
+        block = self.arrays['price/panel'][self.tickers.index(ticker)]
+        valid = np.flatnonzero(~np.isnan(block[PRICE_FIELDS.index('Close')]))
+        rows = slice(valid[0], valid[-1] + 1) if len(valid) else slice(0, 0)
+        return pd.DataFrame(block[:, rows].T, index=self._price_dates()[rows],
+                            columns=PRICE_FIELDS, copy=False)
+
+    def close_panel(self):
+        """Close prices as a dates x tickers DataFrame (view into the panel)."""
+        close = self.arrays['price/panel'][:, PRICE_FIELDS.index('Close'), :]
+        return pd.DataFrame(close.T, index=self._price_dates(), columns=self.tickers, copy=False)
+
+    # --- CLEANUP ---
+
+    def close(self):
+        """Detach this process from the shared memory blocks."""
+        self.arrays = {}
+        for shm in self._handles:
+            try:
+                shm.close()
+                _OPEN_BLOCKS.pop(shm.name, None)
+            except BufferError:
+                pass    # a DataFrame still views the block; it stays mapped
+        self._handles = []
+
+    def unlink(self):
+        """Free the exported data (call once, from the creating process)."""
+        if self.spec['backend'] == 'shm':
+            for shm in self._handles:
+                shm.unlink()
+        else:
+            for location, _, _ in self.spec['arrays'].values():
+                Path(location).unlink(missing_ok=True)
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
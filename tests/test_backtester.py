@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.fa.backtester import Backtester
+
+
+def make_panels(n_days=300, n_tickers=4, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2020-01-01', periods=n_days)
+    tickers = [f"T{i}" for i in range(n_tickers)]
+    close = pd.DataFrame(np.exp(rng.normal(0, 0.01, (n_days, n_tickers)).cumsum(axis=0)),
+                         index=dates, columns=tickers)
+    signal = pd.DataFrame(rng.normal(size=(n_days, n_tickers)), index=dates, columns=tickers)
+    return signal, close
+
+
+def reference_simulation(signal, close, long_above, short_below, holding_period, cost_bps):
+    """Straightforward pandas version of Backtester.simulate."""
+    entries = (signal > long_above).astype(float) - (signal < short_below).astype(float)
+    position = entries.rolling(holding_period, min_periods=1).sum() / holding_period
+    gross = position.abs().sum(axis=1).clip(lower=1.0)
+    weights = position.div(gross, axis=0)
+    prev = weights.shift(1).fillna(0.0)
+    turnover = (weights - prev).abs().sum(axis=1)
+    pnl = (prev * close.pct_change()).sum(axis=1) - turnover * cost_bps / 1e4
+    return pnl.to_numpy(), turnover.to_numpy()
+
+
+@pytest.mark.parametrize("holding_period", [1, 3, 10])
+def test_simulate_matches_pandas_reference(holding_period):
+    signal, close = make_panels()
+    bt = Backtester(signal, close)
+    config = dict(long_above=0.5, short_below=-0.5, holding_period=holding_period, cost_bps=5)
+
+    pnl, turnover = Backtester.simulate(bt.signal, bt.returns, **config)
+    ref_pnl, ref_turnover = reference_simulation(signal, close, **config)
+
+    np.testing.assert_allclose(pnl, ref_pnl, atol=1e-12)
+    np.testing.assert_allclose(turnover, ref_turnover, atol=1e-12)
+
+
+@pytest.mark.parametrize("holding_period", [0, -1, 2.5, True])
+def test_simulate_rejects_invalid_holding_period(holding_period):
+    signal, close = make_panels(n_days=20)
+    bt = Backtester(signal, close)
+    with pytest.raises(ValueError, match="holding_period"):
+        Backtester.simulate(bt.signal, bt.returns, holding_period=holding_period)
+
+
+def test_run_reports_metrics():
+    signal, close = make_panels()
+    result, metrics = Backtester(signal, close).run(long_above=0.0, holding_period=2)
+
+    assert list(result.columns) == ['pnl', 'turnover', 'equity']
+    assert set(metrics) == {'total_return', 'sharpe', 'max_drawdown', 'avg_turnover'}
+    assert metrics['max_drawdown'] <= 0
+
+
+
+def test_sparse_signal_holds_over_trading_days():
+    _, close = make_panels(n_days=10, n_tickers=2)
+    # Signal only on two days, e.g. days with news
+    signal = pd.DataFrame({'T0': [1.0, 1.0], 'T1': [-1.0, 1.0]}, index=close.index[[2, 6]])
+    bt = Backtester(signal, close)
+
+    # Returns stay daily over the full trading calendar from the first signal
+    assert list(bt.dates) == list(close.index[2:])
+    np.testing.assert_allclose(bt.returns, close.pct_change().iloc[2:].to_numpy())
+    assert np.isnan(bt.signal[1:4]).all()
+
+    result, _ = bt.run(long_above=0.0, holding_period=3)
+    # T0 entered on day 2 is held for 3 trading days, not 3 signal rows
+    held = np.flatnonzero(result['turnover'].to_numpy() > 0)
+    assert list(result.index[held]) == list(close.index[[2, 5, 6, 9]])
+    np.testing.assert_allclose(result['pnl'].iloc[1], close['T0'].pct_change().iloc[3] / 3)
+
+
+def test_tz_aware_signal_aligns_with_naive_closes():
+    signal, close = make_panels(n_days=30)
+    aware = signal.tz_localize('US/Eastern')
+    aware.index = aware.index + pd.Timedelta(hours=16)
+
+    bt = Backtester(aware, close)
+    expected = Backtester(signal, close)
+    assert list(bt.dates) == list(expected.dates)
+    np.testing.assert_array_equal(bt.signal, expected.signal)
+
+def test_walk_forward_picks_best_train_config():
+    signal, close = make_panels(n_days=400)
+    # A perfect-foresight signal should beat pure noise on every train window
+    informative = close.pct_change().shift(-1).fillna(0.0)
+    bt = Backtester(informative, close)
+    configs = Backtester.param_grid(long_above=[0.0, 10.0], short_below=[0.0], holding_period=[1])
+
+    folds, oos = bt.walk_forward(configs, n_splits=3, train_days=100, n_jobs=1)
+
+    assert len(folds) == 3
+    assert (folds['long_above'] == 0.0).all()
+    assert len(oos) == 3 * 100
+    assert oos.index.is_monotonic_increasing
+
+
+def test_sweep_in_process_pool_matches_serial():
+    signal, close = make_panels(n_days=100)
+    bt = Backtester(signal, close)
+    configs = Backtester.param_grid(long_above=[0.0, 0.5], holding_period=[1, 5])
+
+    serial = bt.sweep(configs, n_jobs=1)
+    parallel = bt.sweep(configs, n_jobs=2, batch_size=1)
+
+    np.testing.assert_allclose(serial[0], parallel[0])
+    np.testing.assert_allclose(serial[1], parallel[1])
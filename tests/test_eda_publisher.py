@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from src.eda.eda_publisher import EDA_Publisher
+
+
+def news_frame(headlines, publishers):
+    df = pd.DataFrame({'headline': headlines, 'publisher': publishers})
+    df['headline_len'] = df['headline'].str.len()
+    return df
+
+
+def test_content_analysis_handles_small_samples(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    df = news_frame(
+        ["Apple raises guidance", "FDA approves new drug", "Stocks moving premarket"],
+        ["a@reuters.com", "Lisa Levin", "Lisa Levin"],
+    )
+
+    summary = EDA_Publisher(df).publisher_content_analysis(top_n_domains=2)
+    assert set(summary['publisher_domain']) == {'reuters.com', 'lisa levin'}
+
+
+def test_distinctive_terms_per_domain():
+    df = news_frame(
+        ["fda approval granted"] * 3 + ["price target raised"] * 3,
+        ["Charles Gross"] * 3 + ["Lisa Levin"] * 3,
+    )
+
+    terms = EDA_Publisher(df).distinctive_terms(top_n=1, min_df=1)
+    top = dict(zip(terms['publisher_domain'], terms['term']))
+    assert 'fda' in top['charles gross'] or 'approval' in top['charles gross']
+    assert 'price' in top['lisa levin'] or 'target' in top['lisa levin']
+
+
+def analytics_frame(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2020-01-01', periods=60)
+    close = pd.DataFrame(np.exp(rng.normal(0, 0.02, (60, 3)).cumsum(axis=0)),
+                         index=dates, columns=['AAPL', 'MSFT', 'NVDA'])
+    publishers = rng.choice(['a@benzinga.com', 'Lisa Levin', 'Paul Quintaro', 'tiny@rare.com'],
+                            n, p=[0.4, 0.3, 0.29, 0.01])
+    df = news_frame(
+        rng.choice(["price target raised", "shares fall", "fda approval", "earnings beat"], n),
+        publishers,
+    )
+    df['stock'] = rng.choice(['AAPL', 'MSFT', 'NVDA', 'TSLA'], n)     # TSLA has no prices
+    df['date_only'] = pd.DatetimeIndex(rng.choice(dates, n)).date
+    df['sentiment_score'] = rng.normal(size=n)
+    return df, close
+
+
+def test_publisher_analytics_matches_pandas_reference(tmp_path):
+    df, close = analytics_frame()
+    summary, correlations = EDA_Publisher(df).publisher_analytics(
+        close, min_obs=5, min_df=1, save_path=tmp_path / "sentiment.png"
+    )
+
+    # Summary means
+    expected = df.groupby('publisher_domain').agg(
+        articles=('headline', 'size'),
+        avg_headline_len=('headline_len', 'mean'),
+        avg_sentiment=('sentiment_score', 'mean'),
+    )
+    got = summary.set_index('publisher_domain').loc[expected.index]
+    assert (got['articles'] == expected['articles']).all()
+    np.testing.assert_allclose(got['avg_headline_len'], expected['avg_headline_len'])
+    np.testing.assert_allclose(got['avg_sentiment'], expected['avg_sentiment'])
+    assert summary['top_terms'].notna().all()
+
+    # Sentiment vs next-day return, per (domain, ticker)
+    next_ret = close.pct_change().shift(-1).stack().rename('next_ret')
+    merged = df.assign(date=pd.to_datetime(df['date_only'])).merge(
+        next_ret, left_on=['date', 'stock'], right_index=True
+    ).dropna(subset=['next_ret'])
+    merged = merged[merged.groupby(['publisher_domain', 'stock'])['headline'].transform('size') >= 5]
+    grouped = merged.groupby(['publisher_domain', 'stock'])
+    reference = pd.DataFrame({
+        'n_headlines': grouped.size(),
+        'next_day_corr': grouped.apply(lambda g: g['sentiment_score'].corr(g['next_ret'])),
+    })
+
+    got = correlations.set_index(['publisher_domain', 'stock'])
+    assert sorted(got.index) == sorted(reference.index)
+    got = got.loc[reference.index]
+    assert (got['n_headlines'] == reference['n_headlines']).all()
+    np.testing.assert_allclose(got['next_day_corr'], reference['next_day_corr'])
+
+
+def test_publisher_analytics_min_obs_filters_pairs(tmp_path):
+    df, close = analytics_frame()
+    _, correlations = EDA_Publisher(df).publisher_analytics(
+        close, min_obs=20, min_df=1, save_path=tmp_path / "sentiment.png"
+    )
+
+    assert (correlations['n_headlines'] >= 20).all()
+    assert 'rare.com' not in set(correlations['publisher_domain'])
+    assert 'TSLA' not in set(correlations['stock'])
@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from src.feature_store import FeatureStore
+
+
+def news_file(rows):
+    return pd.DataFrame(rows, columns=['headline', 'stock', 'date', 'sentiment_score'])
+
+
+NEWS = news_file([
+    ("Apple beats estimates", 'AAPL', '2020-06-01 10:00:00-04:00', 0.5),
+    ("Apple shares slip", 'AAPL', '2020-06-01 15:00:00-04:00', -0.25),
+    ("Apple neutral note", 'AAPL', '2020-06-02 09:00:00-04:00', 0.0),
+    ("Apple price target raised", 'AAPL', '2020-07-01 09:00:00-04:00', 0.3),
+    ("Microsoft falls", 'MSFT', '2020-06-01 11:00:00-04:00', -0.5),
+])
+
+
+@pytest.fixture
+def store(tmp_path):
+    return FeatureStore(tmp_path / "features")
+
+
+def test_upsert_skips_already_stored_headlines(store):
+    assert store.upsert(NEWS.iloc[:3]) == 3
+    assert store.upsert(NEWS) == 2
+    assert store.upsert(NEWS) == 0
+    # Duplicates inside one file are stored once
+    assert store.upsert(pd.concat([NEWS, NEWS])) == 0
+
+    assert len(store.read_headlines()) == len(NEWS)
+
+
+def test_daily_features(store):
+    store.upsert(NEWS)
+
+    daily = store.read_daily('AAPL')
+    first = daily.loc[pd.Timestamp('2020-06-01').date()]
+    assert first['daily_news_volume'] == 2
+    assert first['avg_daily_sentiment'] == pytest.approx(0.125)
+    assert first['std_daily_sentiment'] == pytest.approx(np.std([0.5, -0.25], ddof=1))
+    assert first['positive_share'] == pytest.approx(0.5)
+    assert first['negative_share'] == pytest.approx(0.5)
+    assert len(daily) == 3
+
+
+def test_reads_filter_by_ticker_and_date_range(store):
+    store.upsert(NEWS)
+
+    june = store.read_headlines('AAPL', start='2020-06-01', end='2020-07-01')
+    assert sorted(june['headline']) == ["Apple beats estimates", "Apple neutral note", "Apple shares slip"]
+    assert list(store.read_daily('AAPL', start='2020-06-02', end='2020-07-01').index) == [
+        pd.Timestamp('2020-06-02').date()
+    ]
+    assert store.read_headlines('MSFT', start='2020-07-01').empty
+
+
+
+def test_ticker_reads_only_list_that_tickers_partitions(store):
+    store.upsert(NEWS)
+    # A broken file under another ticker must not be touched by an AAPL read
+    (store.root / "headlines" / "stock=MSFT" / "month=2020-06" / "part-0.parquet").write_bytes(b"junk")
+
+    assert len(store.read_headlines('AAPL')) == 4
+    assert store.read_headlines('TSLA').empty
+    with pytest.raises(pa.ArrowInvalid):
+        store.read_headlines()
+
+def test_partitions_share_one_schema(store):
+    # AAPL arrives without a publisher column, MSFT with one
+    store.upsert(NEWS[NEWS['stock'] == 'AAPL'])
+    store.upsert(NEWS[NEWS['stock'] == 'MSFT'].assign(publisher='Lisa Levin'))
+
+    headlines = store.read_headlines()
+    assert 'publisher' in headlines.columns
+    by_stock = headlines.groupby('stock')['publisher'].first()
+    assert by_stock['MSFT'] == 'Lisa Levin'
+    assert headlines.loc[headlines['stock'] == 'AAPL', 'publisher'].isna().all()
+
+
+def test_attach_scores(store):
+    store.upsert(NEWS.iloc[:3])
+
+    attached = store.attach_scores(NEWS.drop(columns=['sentiment_score']))
+    np.testing.assert_allclose(attached['sentiment_score'].iloc[:3], NEWS['sentiment_score'].iloc[:3])
+    assert attached['sentiment_score'].iloc[3:].isna().all()
+
+
+def test_read_before_upsert_raises(store):
+    with pytest.raises(FileNotFoundError):
+        store.read_daily('AAPL')
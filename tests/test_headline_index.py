@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.headline_index import HeadlineIndex
+
+
+def news_file(headlines, stocks, dates):
+    # Same shape as DataLoader.load_news_data: a fresh RangeIndex per file
+    return pd.DataFrame({'headline': headlines, 'stock': stocks, 'date': dates})
+
+
+FILE_1 = news_file(
+    ["Goldman raises price target on Apple", "Apple shares rise", "Price target lowered for Microsoft"],
+    ['AAPL', 'AAPL', 'MSFT'],
+    ['2020-07-05 10:00:00-04:00', '2020-08-01', '2020-07-10'],
+)
+FILE_2 = news_file(
+    ["Morgan Stanley boosts price target on Apple"],
+    ['AAPL'],
+    ['2020-09-15'],
+)
+
+
+def test_add_twice_keeps_distinct_ids_and_keys():
+    index = HeadlineIndex.build(FILE_1).add(FILE_2)
+
+    assert sorted(index.doc_id.tolist()) == [0, 1, 2, 3]
+    assert len(np.unique(index.doc_key)) == 4
+
+    result = index.search(all_of='price target')
+    assert len(result) == 3
+    assert len(np.unique(result)) == 3
+
+    rows = pd.concat([index.rows(FILE_1, result), index.rows(FILE_2, result)])
+    assert sorted(rows['headline']) == sorted([
+        "Goldman raises price target on Apple",
+        "Price target lowered for Microsoft",
+        "Morgan Stanley boosts price target on Apple",
+    ])
+
+
+def test_key_col_is_used_as_external_key():
+    file_1 = FILE_1.assign(**{'Unnamed: 0': [10, 11, 12]})
+    file_2 = FILE_2.assign(**{'Unnamed: 0': [13]})
+    index = HeadlineIndex.build(file_1, key_col='Unnamed: 0').add(file_2)
+
+    assert sorted(index.search(all_of='price target').tolist()) == [10, 12, 13]
+
+
+def test_search_filters_by_ticker_and_date_range():
+    index = HeadlineIndex.build(FILE_1).add(FILE_2)
+
+    result = index.search(all_of='price target', ticker='AAPL', start='2020-07-01', end='2020-09-01')
+    assert index.rows(FILE_1, result)['headline'].tolist() == ["Goldman raises price target on Apple"]
+    assert index.count(all_of='price target', ticker='TSLA') == 0
+    assert index.count(all_of='price', none_of='price target') == 0
+    assert index.count(any_of=['shares', 'boosts'], ticker='AAPL') == 2
+
+
+def test_save_and_load_round_trip(tmp_path):
+    index = HeadlineIndex.build(FILE_1)
+    index.save(tmp_path / "index")
+
+    loaded = HeadlineIndex.load(tmp_path / "index").add(FILE_2)
+    assert sorted(loaded.doc_id.tolist()) == [0, 1, 2, 3]
+    assert loaded.count(all_of='price target') == 3
+
+
+def test_adding_the_same_file_twice_is_a_no_op():
+    index = HeadlineIndex.build(FILE_1).add(FILE_1)
+
+    assert len(index) == 3
+    result = index.search(all_of='price target')
+    assert len(result) == len(np.unique(result)) == 2
+
+    # Duplicates inside one file are indexed once as well
+    assert len(HeadlineIndex.build(pd.concat([FILE_2, FILE_2], ignore_index=True))) == 1
+
+
+def test_missing_stock_is_rejected():
+    bad = FILE_2.assign(stock=[np.nan])
+    with pytest.raises(ValueError, match="stock"):
+        HeadlineIndex.build(FILE_1).add(bad)
+
+
+def test_small_add_goes_to_delta_segment():
+    index = HeadlineIndex.build(FILE_1, merge_ratio=1.0)
+    main = index.main
+    index.add(FILE_2)
+
+    assert index.main is main
+    assert len(index.delta) == 1
+    # Results span both segments and stay ordered by (stock, date)
+    result = index.search(all_of='price target', ticker='AAPL')
+    assert index.rows(FILE_2, result[-1:])['headline'].tolist() == [FILE_2['headline'][0]]
+    assert len(result) == 2
+
+    index.merge()
+    assert len(index.delta) == 0 and len(index.main) == 4
+    np.testing.assert_array_equal(index.search(all_of='price target', ticker='AAPL'), result)
@@ -0,0 +1,123 @@
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.shared_data import SharedData
+
+
+@pytest.fixture
+def news_df():
+    df = pd.DataFrame({
+        'headline': ["Apple rises", "Microsoft falls", "Apple target raised"],
+        'stock': ['AAPL', 'MSFT', 'AAPL'],
+        'publisher': ['Lisa Levin', 'Paul Quintaro', 'Lisa Levin'],
+        'date': ['2020-06-05 10:30:00-04:00', '2020-06-06', '2020-06-08 09:00:00-04:00'],
+        'sentiment_score': [0.5, -0.25, 0.1],
+    })
+    # As returned by DataLoader.load_news_data
+    df['date'] = pd.to_datetime(df['date'], format='mixed', utc=True)
+    return df
+
+
+@pytest.fixture
+def price_frames():
+    # As returned by StockDataset.load: upper-case OHLCV columns, Date index
+    def frame(start, n, base):
+        index = pd.date_range(start, periods=n, name='Date')
+        values = base + np.arange(n * 5, dtype=float).reshape(n, 5)
+        return pd.DataFrame(values, index=index, columns=['OPEN', 'HIGH', 'LOW', 'CLOSE', 'VOLUME'])
+    return {'AAPL': frame('2020-06-01', 10, 100.0), 'MSFT': frame('2020-06-03', 5, 200.0)}
+
+
+def _worker_summary(spec):
+    data = SharedData.attach(spec)
+    news, prices = data.news_frame(), data.price_frame('MSFT')
+    result = (
+        str(news['date'].dtype),
+        news['stock'].tolist(),
+        float(prices['Close'].sum()),
+        np.shares_memory(prices['Close'].to_numpy(), data.arrays['price/panel']),
+    )
+    del news, prices
+    data.close()
+    return result
+
+
+@pytest.mark.parametrize("backend", ['shm', 'npy'])
+def test_news_frame_round_trip(news_df, backend, tmp_path):
+    data = SharedData.create(news_df, backend=backend, path=tmp_path)
+    try:
+        view = SharedData.attach(data.spec).news_frame()
+        assert str(view['date'].dtype) == 'datetime64[ns, UTC]'
+        pd.testing.assert_series_equal(view['date'], news_df['date'].dt.as_unit('ns'))
+        assert view['stock'].tolist() == news_df['stock'].tolist()
+        assert view['publisher'].tolist() == news_df['publisher'].tolist()
+        np.testing.assert_array_equal(view['sentiment_score'], news_df['sentiment_score'])
+        del view
+    finally:
+        data.unlink()
+
+
+
+def test_news_dates_share_memory_on_installed_pandas(news_df, price_frames):
+    data = SharedData.create(news_df, price_frames)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            attached = SharedData.attach(data.spec)
+            dates = attached.news_frame()['date']
+        assert str(dates.dtype) == 'datetime64[ns, UTC]'
+        assert np.shares_memory(dates.array._ndarray, attached.arrays['news/date']), \
+            f"news 'date' is copied on pandas {pd.__version__}"
+        del dates
+    finally:
+        data.unlink()
+
+
+def test_views_are_zero_copy_and_read_only(news_df, price_frames):
+    data = SharedData.create(news_df, price_frames)
+    try:
+        attached = SharedData.attach(data.spec)
+        news = attached.news_frame()
+        assert np.shares_memory(news['date'].array._ndarray, attached.arrays['news/date'])
+        assert np.shares_memory(news['sentiment_score'].to_numpy(), attached.arrays['news/sentiment_score'])
+
+        prices = attached.price_frame('AAPL')
+        assert np.shares_memory(prices['Close'].to_numpy(), attached.arrays['price/panel'])
+        with pytest.raises(ValueError):
+            attached.arrays['price/panel'][0, 0, 0] = 1.0
+        del news, prices
+        attached.close()
+    finally:
+        data.unlink()
+
+
+def test_price_frame_trims_to_ticker_dates(news_df, price_frames):
+    data = SharedData.create(price_frames=price_frames)
+    try:
+        msft = data.price_frame('MSFT')
+        pd.testing.assert_index_equal(msft.index, price_frames['MSFT'].index.as_unit('ns'))
+        np.testing.assert_array_equal(msft.to_numpy(), price_frames['MSFT'].to_numpy())
+
+        close = data.close_panel()
+        assert list(close.columns) == ['AAPL', 'MSFT']
+        assert close['MSFT'].isna().sum() == 5
+        with pytest.raises(ValueError):
+            data.price_frame('TSLA')
+        del msft, close
+    finally:
+        data.unlink()
+
+
+def test_workers_attach_from_spec(news_df, price_frames):
+    data = SharedData.create(news_df, price_frames)
+    try:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_worker_summary, [data.spec, data.spec]))
+        expected_close = float(price_frames['MSFT']['CLOSE'].sum())
+        assert results == [('datetime64[ns, UTC]', ['AAPL', 'MSFT', 'AAPL'], expected_close, True)] * 2
+    finally:
+        data.unlink()